@@ -5,6 +5,8 @@ from database.connection import setup_database
 from routes.auth import login, session_status
 from routes.items import get_items, add_item, update_item, delete_item, export_items, import_items
 from routes.category_order import get_category_order, update_category_order, delete_category_order
+from routes.profiling import list_profiles, get_profile, get_profile_stacks
+from utils.profiler import start_request_profile, finish_request_profile, stop_request_profile
 
 # --- FLASK SETUP ---
 app = Flask(__name__)
@@ -13,6 +15,13 @@ CORS(app)
 # Initialize the database on startup
 setup_database()
 
+# --- REQUEST PROFILING ---
+# ADMIN_TOKEN holders can profile a single request (X-Profile: 1 or ?profile=1);
+# PROFILE_SAMPLE_EVERY=N additionally profiles 1-in-N requests per route.
+app.before_request(start_request_profile)
+app.after_request(finish_request_profile)
+app.teardown_request(stop_request_profile)
+
 # --- HEALTH CHECK ENDPOINT ---
 @app.route('/health', methods=['GET'])
 def health_check():
@@ -32,6 +41,23 @@ app.route('/api/category-order', methods=['GET'])(get_category_order)
 app.route('/api/category-order', methods=['PUT'])(update_category_order)
 app.route('/api/category-order/<string:category_name>', methods=['DELETE'])(delete_category_order)
 
+# --- WORKSPACE-SCOPED API ROUTES ---
+# The unscoped routes above serve the default workspace.
+app.route('/api/w/<string:workspace>/items', methods=['GET'])(get_items)
+app.route('/api/w/<string:workspace>/items', methods=['POST'])(add_item)
+app.route('/api/w/<string:workspace>/items/<string:item_id>', methods=['PUT'])(update_item)
+app.route('/api/w/<string:workspace>/items/<string:item_id>', methods=['DELETE'])(delete_item)
+app.route('/api/w/<string:workspace>/items/export', methods=['GET'])(export_items)
+app.route('/api/w/<string:workspace>/items/import', methods=['POST'])(import_items)
+app.route('/api/w/<string:workspace>/category-order', methods=['GET'])(get_category_order)
+app.route('/api/w/<string:workspace>/category-order', methods=['PUT'])(update_category_order)
+app.route('/api/w/<string:workspace>/category-order/<string:category_name>', methods=['DELETE'])(delete_category_order)
+
+# --- ADMIN PROFILING ROUTES ---
+app.route('/api/admin/profiles', methods=['GET'])(list_profiles)
+app.route('/api/admin/profiles/<string:profile_id>', methods=['GET'])(get_profile)
+app.route('/api/admin/profiles/<string:profile_id>/collapsed', methods=['GET'])(get_profile_stacks)
+
 # --- RUN THE APP ---
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0', port=5000)
@@ -1,4 +1,5 @@
 import os
+import re
 
 
 def require_env(var_name):
@@ -18,4 +19,39 @@ DB_NAME = require_env('MYSQL_DATABASE')
 # Admin credentials (used for protecting write APIs)
 ADMIN_USERNAME = require_env('ADMIN_USERNAME')
 ADMIN_PASSWORD = require_env('ADMIN_PASSWORD')
-ADMIN_TOKEN = require_env('ADMIN_TOKEN')
\ No newline at end of file
+ADMIN_TOKEN = require_env('ADMIN_TOKEN')
+
+
+def require_workspace_key(value, var_name):
+    """Fail fast if a configured workspace key could never match a workspace route."""
+    if not WORKSPACE_PATTERN.match(value):
+        raise RuntimeError(f"Invalid workspace key in {var_name}: {value!r}")
+    return value
+
+
+def parse_token_map(var_name):
+    """Parse an optional 'workspace:token,workspace:token' env var into a dict."""
+    tokens = {}
+    for pair in os.getenv(var_name, '').split(','):
+        workspace, sep, token = pair.strip().partition(':')
+        if sep and workspace.strip() and token.strip():
+            tokens[workspace.strip()] = token.strip()
+    return tokens
+
+
+# Workspaces (each team gets its own partition of items and categories).
+# Keys are case-sensitive, matching the ascii_bin workspace columns.
+WORKSPACE_PATTERN = re.compile(r'^[A-Za-z0-9_-]{1,64}$')
+DEFAULT_WORKSPACE = require_workspace_key(os.getenv('DEFAULT_WORKSPACE', 'default'), 'DEFAULT_WORKSPACE')
+
+# Optional per-workspace admin tokens; ADMIN_TOKEN stays valid for every workspace
+WORKSPACE_ADMIN_TOKENS = parse_token_map('WORKSPACE_ADMIN_TOKENS')
+
+# Maximum number of workspaces whose reads are kept in the in-process cache
+READ_CACHE_MAX_WORKSPACES = int(os.getenv('READ_CACHE_MAX_WORKSPACES', '256'))
+
+# Request profiling (ADMIN_TOKEN holders can also profile a single request via X-Profile: 1 or ?profile=1)
+PROFILE_SAMPLE_EVERY = int(os.getenv('PROFILE_SAMPLE_EVERY', '0'))  # profile 1-in-N requests per route, 0 = off
+PROFILE_INTERVAL_MS = float(os.getenv('PROFILE_INTERVAL_MS', '5'))
+PROFILE_OUTPUT_DIR = os.getenv('PROFILE_OUTPUT_DIR', '/tmp/dashboard-profiles')
+PROFILE_MAX_FILES = int(os.getenv('PROFILE_MAX_FILES', '50'))  # kept separately for admin and sampled profiles
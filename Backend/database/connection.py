@@ -1,6 +1,6 @@
 import mysql.connector
 from mysql.connector import Error
-from config import DB_HOST, DB_USER, DB_PASSWORD, DB_NAME
+from config import DB_HOST, DB_USER, DB_PASSWORD, DB_NAME, DEFAULT_WORKSPACE
 
 def get_db_connection():
     """Establishes and returns a connection to the MySQL database."""
@@ -17,7 +17,7 @@ def get_db_connection():
         return None
 
 def setup_database():
-    """Ensures the necessary table exists in the database."""
+    """Ensures the necessary tables exist in the database."""
     conn = get_db_connection()
     if conn is None:
         return
@@ -28,7 +28,8 @@ def setup_database():
         # Create dashboard_items table
         create_table_query = """
         CREATE TABLE IF NOT EXISTS dashboard_items (
-            id VARCHAR(36) PRIMARY KEY,
+            workspace VARCHAR(64) CHARACTER SET ascii COLLATE ascii_bin NOT NULL DEFAULT %s,
+            id VARCHAR(36) NOT NULL,
             name VARCHAR(255) NOT NULL,
             url VARCHAR(2048) NOT NULL,
             description TEXT,
@@ -40,19 +41,34 @@ def setup_database():
             order_index DOUBLE,
             is_admin_only BOOLEAN DEFAULT FALSE,
             size VARCHAR(20) DEFAULT 'medium',
-            environment VARCHAR(20) DEFAULT 'common'
+            environment VARCHAR(20) DEFAULT 'common',
+            PRIMARY KEY (workspace, id),
+            INDEX idx_items_workspace_category (workspace, category, order_index)
         );
         """
-        cursor.execute(create_table_query)
+        cursor.execute(create_table_query, (DEFAULT_WORKSPACE,))
         
         # Create category_order table
         create_category_order_table = """
         CREATE TABLE IF NOT EXISTS category_order (
-            category_name VARCHAR(100) PRIMARY KEY,
-            order_index INT NOT NULL DEFAULT 0
+            workspace VARCHAR(64) CHARACTER SET ascii COLLATE ascii_bin NOT NULL DEFAULT %s,
+            category_name VARCHAR(100) NOT NULL,
+            order_index INT NOT NULL DEFAULT 0,
+            PRIMARY KEY (workspace, category_name),
+            INDEX idx_category_order_workspace_order (workspace, order_index)
         );
         """
-        cursor.execute(create_category_order_table)
+        cursor.execute(create_category_order_table, (DEFAULT_WORKSPACE,))
+        
+        # Create workspace_versions table. Every write to a workspace bumps its
+        # version so cached reads can be revalidated with a single key lookup.
+        create_workspace_versions_table = """
+        CREATE TABLE IF NOT EXISTS workspace_versions (
+            workspace VARCHAR(64) CHARACTER SET ascii COLLATE ascii_bin PRIMARY KEY,
+            version BIGINT NOT NULL DEFAULT 0
+        );
+        """
+        cursor.execute(create_workspace_versions_table)
         
         # Ensure existing deployments upgrade from FLOAT to DOUBLE so that
         # large order_index values (used for drag/drop) retain precision.
@@ -94,10 +110,91 @@ def setup_database():
         if environment_column_exists == 0:
             cursor.execute("ALTER TABLE dashboard_items ADD COLUMN environment VARCHAR(20) DEFAULT 'common'")
         
+        # Partition existing single-list deployments into the default workspace
+        for table_name, key_column in (('dashboard_items', 'id'), ('category_order', 'category_name')):
+            ensure_workspace_partition(cursor, table_name, key_column)
+        
+        # Workspace keys are case-sensitive, so compare them byte for byte
+        ensure_workspace_collation(cursor, 'workspace_versions', 'NOT NULL')
+        
+        ensure_index(cursor, 'dashboard_items', 'idx_items_workspace_category',
+                     '(workspace, category, order_index)')
+        ensure_index(cursor, 'category_order', 'idx_category_order_workspace_order',
+                     '(workspace, order_index)')
+        
         conn.commit()
     except Error as e:
         print(f"Error setting up database: {e}")
     finally:
         if conn and conn.is_connected():
             cursor.close()
-            conn.close()
\ No newline at end of file
+            conn.close()
+
+def ensure_workspace_partition(cursor, table_name, key_column):
+    """Add the workspace column to a legacy table and make it lead the primary key."""
+    cursor.execute("""
+        SELECT COUNT(*) 
+        FROM information_schema.COLUMNS 
+        WHERE TABLE_SCHEMA = DATABASE() 
+        AND TABLE_NAME = %s 
+        AND COLUMN_NAME = 'workspace'
+    """, (table_name,))
+    workspace_column_exists = cursor.fetchone()[0]
+    if workspace_column_exists == 0:
+        cursor.execute(
+            f"ALTER TABLE {table_name} "
+            "ADD COLUMN workspace VARCHAR(64) CHARACTER SET ascii COLLATE ascii_bin "
+            "NOT NULL DEFAULT %s FIRST",
+            (DEFAULT_WORKSPACE,)
+        )
+    else:
+        ensure_workspace_collation(cursor, table_name, 'NOT NULL DEFAULT %s', (DEFAULT_WORKSPACE,))
+
+    cursor.execute("""
+        SELECT COLUMN_NAME 
+        FROM information_schema.STATISTICS 
+        WHERE TABLE_SCHEMA = DATABASE() 
+        AND TABLE_NAME = %s 
+        AND INDEX_NAME = 'PRIMARY' 
+        AND SEQ_IN_INDEX = 1
+    """, (table_name,))
+    row = cursor.fetchone()
+    if row is None:
+        cursor.execute(f"ALTER TABLE {table_name} ADD PRIMARY KEY (workspace, {key_column})")
+    elif row[0] != 'workspace':
+        cursor.execute(
+            f"ALTER TABLE {table_name} "
+            f"DROP PRIMARY KEY, ADD PRIMARY KEY (workspace, {key_column})"
+        )
+
+
+def ensure_index(cursor, table_name, index_name, columns):
+    """Create a secondary index on an existing table if it is missing."""
+    cursor.execute("""
+        SELECT COUNT(*) 
+        FROM information_schema.STATISTICS 
+        WHERE TABLE_SCHEMA = DATABASE() 
+        AND TABLE_NAME = %s 
+        AND INDEX_NAME = %s
+    """, (table_name, index_name))
+    index_exists = cursor.fetchone()[0]
+    if index_exists == 0:
+        cursor.execute(f"CREATE INDEX {index_name} ON {table_name} {columns}")
+
+
+def ensure_workspace_collation(cursor, table_name, column_options, params=()):
+    """Switch a workspace column created before keys were case-sensitive to ascii_bin."""
+    cursor.execute("""
+        SELECT COLLATION_NAME 
+        FROM information_schema.COLUMNS 
+        WHERE TABLE_SCHEMA = DATABASE() 
+        AND TABLE_NAME = %s 
+        AND COLUMN_NAME = 'workspace'
+    """, (table_name,))
+    row = cursor.fetchone()
+    if row is not None and row[0] != 'ascii_bin':
+        cursor.execute(
+            f"ALTER TABLE {table_name} "
+            f"MODIFY COLUMN workspace VARCHAR(64) CHARACTER SET ascii COLLATE ascii_bin {column_options}",
+            params
+        )
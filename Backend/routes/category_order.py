@@ -1,21 +1,31 @@
 from flask import jsonify, request
 from database.connection import get_db_connection
 from utils.auth_helper import require_admin
+from utils.workspace_helpers import workspace_scoped, get_workspace_version, bump_workspace_version, read_cache
 
-def get_category_order():
-    """Get all category orders."""
+@workspace_scoped
+def get_category_order(workspace):
+    """Get all category orders of a workspace."""
     conn = get_db_connection()
     if conn is None:
         return jsonify({"error": "Database connection failed"}), 500
 
     try:
         cursor = conn.cursor(dictionary=True)
-        query = "SELECT category_name, order_index FROM category_order ORDER BY order_index"
-        cursor.execute(query)
+        
+        # Serve from the workspace cache while no write has happened since
+        version = get_workspace_version(cursor, workspace)
+        cached = read_cache.get(workspace, 'category_order', version)
+        if cached is not None:
+            return jsonify(cached)
+        
+        query = "SELECT category_name, order_index FROM category_order WHERE workspace = %s ORDER BY order_index"
+        cursor.execute(query, (workspace,))
         orders = cursor.fetchall()
         
         # Convert to dictionary format: {category_name: order_index}
         result = {row['category_name']: row['order_index'] for row in orders}
+        read_cache.set(workspace, 'category_order', version, result)
         return jsonify(result)
         
     except Exception as e:
@@ -26,8 +36,9 @@ def get_category_order():
             cursor.close()
             conn.close()
 
+@workspace_scoped
 @require_admin
-def update_category_order():
+def update_category_order(workspace):
     """Update category order. Expects JSON: {category_name: order_index, ...}"""
     data = request.json
     if not data or not isinstance(data, dict):
@@ -43,12 +54,13 @@ def update_category_order():
         # Use INSERT ... ON DUPLICATE KEY UPDATE for upsert behavior
         for category_name, order_index in data.items():
             query = """
-            INSERT INTO category_order (category_name, order_index) 
-            VALUES (%s, %s)
+            INSERT INTO category_order (workspace, category_name, order_index) 
+            VALUES (%s, %s, %s)
             ON DUPLICATE KEY UPDATE order_index = %s
             """
-            cursor.execute(query, (category_name, order_index, order_index))
+            cursor.execute(query, (workspace, category_name, order_index, order_index))
         
+        bump_workspace_version(cursor, workspace)
         conn.commit()
         return jsonify({"message": "Category order updated successfully"}), 200
         
@@ -61,8 +73,9 @@ def update_category_order():
             cursor.close()
             conn.close()
 
+@workspace_scoped
 @require_admin
-def delete_category_order(category_name):
+def delete_category_order(category_name, workspace):
     """Delete a category order entry (when category is deleted)."""
     conn = get_db_connection()
     if conn is None:
@@ -70,8 +83,9 @@ def delete_category_order(category_name):
 
     try:
         cursor = conn.cursor()
-        query = "DELETE FROM category_order WHERE category_name = %s"
-        cursor.execute(query, (category_name,))
+        query = "DELETE FROM category_order WHERE workspace = %s AND category_name = %s"
+        cursor.execute(query, (workspace, category_name))
+        bump_workspace_version(cursor, workspace)
         conn.commit()
         return jsonify({"message": "Category order deleted successfully"}), 200
         
@@ -1,12 +1,13 @@
 import uuid
 from flask import jsonify, request
 from database.connection import get_db_connection
-from utils.auth_helper import require_admin, extract_token
+from utils.auth_helper import require_admin, extract_token, is_admin_token
 from utils.category_helpers import ensure_category_order_exists
-from config import ADMIN_TOKEN
+from utils.workspace_helpers import workspace_scoped, get_workspace_version, bump_workspace_version, read_cache
 
-def get_items():
-    """Retrieves all dashboard items, ordered by category and order_index."""
+@workspace_scoped
+def get_items(workspace):
+    """Retrieves a workspace's dashboard items, ordered by category and order_index."""
     conn = get_db_connection()
     if conn is None:
         return jsonify({"error": "Database connection failed"}), 500
@@ -17,16 +18,24 @@ def get_items():
         
         # Check if user is admin
         token = extract_token()
-        is_admin = (token == ADMIN_TOKEN)
+        is_admin = is_admin_token(token, workspace)
+        
+        # Serve from the workspace cache while no write has happened since
+        cache_key = ('items', is_admin)
+        version = get_workspace_version(cursor, workspace)
+        cached = read_cache.get(workspace, cache_key, version)
+        if cached is not None:
+            return jsonify(cached)
         
         # If admin, return all items. Otherwise, filter out admin-only items
         if is_admin:
-            query = "SELECT * FROM dashboard_items ORDER BY category, order_index"
+            query = "SELECT * FROM dashboard_items WHERE workspace = %s ORDER BY category, order_index"
         else:
-            query = "SELECT * FROM dashboard_items WHERE is_admin_only = FALSE OR is_admin_only IS NULL ORDER BY category, order_index"
+            query = "SELECT * FROM dashboard_items WHERE workspace = %s AND (is_admin_only = FALSE OR is_admin_only IS NULL) ORDER BY category, order_index"
         
-        cursor.execute(query)
+        cursor.execute(query, (workspace,))
         items = cursor.fetchall()
+        read_cache.set(workspace, cache_key, version, items)
         
     except Exception as e:
         print(f"Error fetching items: {e}")
@@ -38,8 +47,9 @@ def get_items():
     
     return jsonify(items)
 
+@workspace_scoped
 @require_admin
-def add_item():
+def add_item(workspace):
     """Adds a new dashboard item."""
     data = request.json
     if not data or not all(k in data for k in ['name', 'url']):
@@ -68,16 +78,17 @@ def add_item():
         cursor = conn.cursor()
         query = """
         INSERT INTO dashboard_items 
-        (id, name, url, description, icon, category, category_icon, username, secret_key, order_index, is_admin_only, size, environment) 
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+        (workspace, id, name, url, description, icon, category, category_icon, username, secret_key, order_index, is_admin_only, size, environment) 
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
         """
         cursor.execute(query, (
-            item_id, name, url, description, icon, category, category_icon, username, secret_key, order_index, is_admin_only, size, environment
+            workspace, item_id, name, url, description, icon, category, category_icon, username, secret_key, order_index, is_admin_only, size, environment
         ))
+        bump_workspace_version(cursor, workspace)
         conn.commit()
         
         # Ensure category exists in category_order table
-        ensure_category_order_exists(category)
+        ensure_category_order_exists(category, workspace)
         
         return jsonify({"message": "Item added successfully", "id": item_id}), 201
     except Exception as e:
@@ -88,8 +99,9 @@ def add_item():
             cursor.close()
             conn.close()
 
+@workspace_scoped
 @require_admin
-def update_item(item_id):
+def update_item(item_id, workspace):
     """Updates an existing dashboard item."""
     data = request.json
     if not data:
@@ -105,7 +117,7 @@ def update_item(item_id):
         # Ensure the item exists before attempting an update. MySQL returns
         # rowcount 0 when values are unchanged, which was incorrectly treated
         # as "not found" during reordering.
-        cursor.execute("SELECT 1 FROM dashboard_items WHERE id = %s", (item_id,))
+        cursor.execute("SELECT 1 FROM dashboard_items WHERE workspace = %s AND id = %s", (workspace, item_id))
         if cursor.fetchone() is None:
             return jsonify({"error": "Item not found"}), 404
         
@@ -135,11 +147,12 @@ def update_item(item_id):
         if not set_clauses:
             return jsonify({"error": "No valid fields to update"}), 400
 
-        values.append(item_id)
+        values.extend([workspace, item_id])
 
-        query = f"UPDATE dashboard_items SET {', '.join(set_clauses)} WHERE id = %s"
+        query = f"UPDATE dashboard_items SET {', '.join(set_clauses)} WHERE workspace = %s AND id = %s"
         
         cursor.execute(query, tuple(values))
+        bump_workspace_version(cursor, workspace)
         conn.commit()
 
         # cursor.rowcount can be 0 when the new values equal the existing ones.
@@ -153,8 +166,9 @@ def update_item(item_id):
             cursor.close()
             conn.close()
 
+@workspace_scoped
 @require_admin
-def delete_item(item_id):
+def delete_item(item_id, workspace):
     """Deletes a dashboard item."""
     conn = get_db_connection()
     if conn is None:
@@ -162,13 +176,14 @@ def delete_item(item_id):
 
     try:
         cursor = conn.cursor()
-        query = "DELETE FROM dashboard_items WHERE id = %s"
-        cursor.execute(query, (item_id,))
-        conn.commit()
-
+        query = "DELETE FROM dashboard_items WHERE workspace = %s AND id = %s"
+        cursor.execute(query, (workspace, item_id))
         if cursor.rowcount == 0:
             return jsonify({"error": "Item not found"}), 404
 
+        bump_workspace_version(cursor, workspace)
+        conn.commit()
+
         return jsonify({"message": "Item deleted successfully"}), 200
     except Exception as e:
         print(f"Error deleting item {item_id}: {e}")
@@ -179,17 +194,18 @@ def delete_item(item_id):
             conn.close()
 
 
+@workspace_scoped
 @require_admin
-def export_items():
-    """Export all items (admin only) in a transport-friendly payload."""
+def export_items(workspace):
+    """Export a workspace's items (admin only) in a transport-friendly payload."""
     conn = get_db_connection()
     if conn is None:
         return jsonify({"error": "Database connection failed"}), 500
 
     try:
         cursor = conn.cursor(dictionary=True)
-        query = "SELECT * FROM dashboard_items ORDER BY category, order_index"
-        cursor.execute(query)
+        query = "SELECT * FROM dashboard_items WHERE workspace = %s ORDER BY category, order_index"
+        cursor.execute(query, (workspace,))
         items = cursor.fetchall()
         return jsonify({"items": items}), 200
     except Exception as e:
@@ -201,9 +217,10 @@ def export_items():
             conn.close()
 
 
+@workspace_scoped
 @require_admin
-def import_items():
-    """Import a list of items. Optionally replace all existing items first."""
+def import_items(workspace):
+    """Import a list of items. Optionally replace the workspace's existing items first."""
     payload = request.get_json(silent=True) or {}
     incoming_items = payload.get("items") or payload.get("data")
     replace_existing = bool(payload.get("replaceExisting", False))
@@ -218,13 +235,12 @@ def import_items():
     try:
         cursor = conn.cursor()
         if replace_existing:
-            cursor.execute("DELETE FROM dashboard_items")
-            conn.commit()
+            cursor.execute("DELETE FROM dashboard_items WHERE workspace = %s", (workspace,))
 
         insert_query = """
             INSERT INTO dashboard_items
-            (id, name, url, description, icon, category, category_icon, username, secret_key, order_index, is_admin_only, size, environment)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+            (workspace, id, name, url, description, icon, category, category_icon, username, secret_key, order_index, is_admin_only, size, environment)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
             ON DUPLICATE KEY UPDATE
                 name = VALUES(name),
                 url = VALUES(url),
@@ -261,6 +277,7 @@ def import_items():
             environment = item.get("environment") or "common"
 
             cursor.execute(insert_query, (
+                workspace,
                 item_id,
                 name,
                 url,
@@ -276,6 +293,7 @@ def import_items():
                 environment
             ))
 
+        bump_workspace_version(cursor, workspace)
         conn.commit()
         return jsonify({"message": "Import completed", "count": len(incoming_items)}), 200
     except Exception as e:
@@ -0,0 +1,37 @@
+from flask import jsonify, Response
+from utils.auth_helper import require_admin
+from utils.profiler import list_profile_ids, load_profile_summary, load_profile_stacks
+
+
+@require_admin
+def list_profiles():
+    """List stored request profiles, newest first, without their function tables."""
+    profiles = []
+    for profile_id in list_profile_ids():
+        summary = load_profile_summary(profile_id)
+        if summary is not None:
+            summary.pop("topFunctions", None)
+            profiles.append(summary)
+    return jsonify({"profiles": profiles}), 200
+
+
+@require_admin
+def get_profile(profile_id):
+    """Return a profile summary including its top functions."""
+    summary = load_profile_summary(profile_id)
+    if summary is None:
+        return jsonify({"error": "Profile not found"}), 404
+    return jsonify(summary), 200
+
+
+@require_admin
+def get_profile_stacks(profile_id):
+    """Download a profile's collapsed stacks (input for flamegraph.pl / speedscope)."""
+    stacks = load_profile_stacks(profile_id)
+    if stacks is None:
+        return jsonify({"error": "Profile not found"}), 404
+    return Response(
+        stacks,
+        mimetype='text/plain',
+        headers={"Content-Disposition": f"attachment; filename={profile_id}.collapsed"}
+    )
@@ -1,6 +1,6 @@
 from functools import wraps
 from flask import request, jsonify
-from config import ADMIN_USERNAME, ADMIN_PASSWORD, ADMIN_TOKEN
+from config import ADMIN_USERNAME, ADMIN_PASSWORD, ADMIN_TOKEN, WORKSPACE_ADMIN_TOKENS
 
 
 def extract_token():
@@ -12,12 +12,28 @@ def extract_token():
     return auth_header or request.headers.get('X-Admin-Token')
 
 
+def is_admin_token(token, workspace):
+    """
+    Check a token against the global admin token or the workspace's own token.
+    Pass workspace=None for routes outside any workspace; only ADMIN_TOKEN is accepted there.
+    """
+    if not token:
+        return False
+    if token == ADMIN_TOKEN:
+        return True
+    return workspace is not None and token == WORKSPACE_ADMIN_TOKENS.get(workspace)
+
+
 def require_admin(func):
-    """Decorator to guard routes that mutate data."""
+    """
+    Decorator to guard routes that mutate data.
+    Workspace tokens only count when a workspace is in scope, so list it
+    below @workspace_scoped, which fills in the workspace argument.
+    """
     @wraps(func)
     def wrapper(*args, **kwargs):
         token = extract_token()
-        if token != ADMIN_TOKEN:
+        if not is_admin_token(token, kwargs.get('workspace')):
             return jsonify({"error": "Unauthorized"}), 401
         return func(*args, **kwargs)
     return wrapper
@@ -1,9 +1,11 @@
 """Helper functions for category management."""
 from database.connection import get_db_connection
+from config import DEFAULT_WORKSPACE
+from utils.workspace_helpers import bump_workspace_version
 
-def ensure_category_order_exists(category_name):
+def ensure_category_order_exists(category_name, workspace=DEFAULT_WORKSPACE):
     """
-    Ensure a category exists in category_order table.
+    Ensure a category exists in the workspace's category_order entries.
     Creates entry with default order if it doesn't exist.
     """
     conn = get_db_connection()
@@ -14,16 +16,21 @@ def ensure_category_order_exists(category_name):
         cursor = conn.cursor()
         
         # Get max order_index to append new category at the end
-        cursor.execute("SELECT COALESCE(MAX(order_index), -1) as max_order FROM category_order")
+        cursor.execute(
+            "SELECT COALESCE(MAX(order_index), -1) as max_order FROM category_order WHERE workspace = %s",
+            (workspace,)
+        )
         max_order = cursor.fetchone()[0]
         
         # Insert if not exists
         query = """
-        INSERT INTO category_order (category_name, order_index) 
-        VALUES (%s, %s)
+        INSERT INTO category_order (workspace, category_name, order_index) 
+        VALUES (%s, %s, %s)
         ON DUPLICATE KEY UPDATE category_name = category_name
         """
-        cursor.execute(query, (category_name, max_order + 1))
+        cursor.execute(query, (workspace, category_name, max_order + 1))
+        if cursor.rowcount == 1:
+            bump_workspace_version(cursor, workspace)
         conn.commit()
         return True
         
@@ -36,9 +43,9 @@ def ensure_category_order_exists(category_name):
             conn.close()
 
 
-def sync_category_orders():
+def sync_category_orders(workspace=DEFAULT_WORKSPACE):
     """
-    Synchronize category_order with actual categories in dashboard_items.
+    Synchronize a workspace's category_order with its categories in dashboard_items.
     Adds missing categories and optionally removes orphaned ones.
     """
     conn = get_db_connection()
@@ -49,31 +56,38 @@ def sync_category_orders():
         cursor = conn.cursor()
         
         # Get all unique categories from items
-        cursor.execute("SELECT DISTINCT category FROM dashboard_items WHERE category IS NOT NULL")
+        cursor.execute(
+            "SELECT DISTINCT category FROM dashboard_items WHERE workspace = %s AND category IS NOT NULL",
+            (workspace,)
+        )
         existing_categories = [row[0] for row in cursor.fetchall()]
         
         # Get max order for appending
-        cursor.execute("SELECT COALESCE(MAX(order_index), -1) as max_order FROM category_order")
+        cursor.execute(
+            "SELECT COALESCE(MAX(order_index), -1) as max_order FROM category_order WHERE workspace = %s",
+            (workspace,)
+        )
         max_order = cursor.fetchone()[0]
         
         # Add missing categories
         for idx, category in enumerate(existing_categories):
             query = """
-            INSERT INTO category_order (category_name, order_index) 
-            VALUES (%s, %s)
+            INSERT INTO category_order (workspace, category_name, order_index) 
+            VALUES (%s, %s, %s)
             ON DUPLICATE KEY UPDATE category_name = category_name
             """
-            cursor.execute(query, (category, max_order + idx + 1))
+            cursor.execute(query, (workspace, category, max_order + idx + 1))
         
         # Optional: Remove categories that no longer have items
         # Uncomment if you want automatic cleanup
         # cursor.execute("""
         #     DELETE FROM category_order 
-        #     WHERE category_name NOT IN (
-        #         SELECT DISTINCT category FROM dashboard_items
+        #     WHERE workspace = %s AND category_name NOT IN (
+        #         SELECT DISTINCT category FROM dashboard_items WHERE workspace = %s
         #     )
-        # """)
+        # """, (workspace, workspace))
         
+        bump_workspace_version(cursor, workspace)
         conn.commit()
         return True
         
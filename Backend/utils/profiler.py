@@ -0,0 +1,226 @@
+"""Helper functions for on-demand and sampled request profiling."""
+import json
+import os
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timezone
+from flask import g, request
+from config import PROFILE_SAMPLE_EVERY, PROFILE_INTERVAL_MS, PROFILE_OUTPUT_DIR, PROFILE_MAX_FILES
+from utils.auth_helper import extract_token, is_admin_token
+
+# Ids start with a microsecond UTC timestamp so sorting them orders profiles by age
+PROFILE_ID_PATTERN = re.compile(r'^\d{8}T\d{12}-(admin|sampled)-[0-9a-f]{8}$')
+TOP_FUNCTIONS_LIMIT = 25
+
+_route_counters = Counter()
+_route_counters_lock = threading.Lock()
+
+
+class StackSampler:
+    """
+    Periodically samples the call stack of one thread from a background thread.
+
+    Stacks are kept in collapsed form ("outer;inner;leaf" -> sample count),
+    which is the input format flame-graph tools expect.
+    """
+
+    def __init__(self, thread_id, interval):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self.started_at = None
+        self.duration = 0.0
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self.started_at = time.perf_counter()
+        self._thread.start()
+
+    def stop(self):
+        if self._stopped.is_set():
+            return
+        self._stopped.set()
+        self._thread.join()
+        self.duration = time.perf_counter() - self.started_at
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            # Skip the sample if the request thread is already waiting in stop()
+            if frame is not None and not self._stopped.is_set():
+                self.stacks[collapse_stack(frame)] += 1
+
+
+def frame_label(code):
+    """Label a function as 'name (dir/file.py:line)' for flame graphs."""
+    path = '/'.join(code.co_filename.replace('\\', '/').split('/')[-2:])
+    return f"{code.co_name} ({path}:{code.co_firstlineno})".replace(';', ':')
+
+
+def collapse_stack(frame):
+    """Turn a frame chain into a root-first, semicolon-separated stack."""
+    labels = []
+    while frame is not None:
+        labels.append(frame_label(frame.f_code))
+        frame = frame.f_back
+    return ';'.join(reversed(labels))
+
+
+def summarize_stacks(stacks):
+    """Return the top functions by self samples, with inclusive counts."""
+    total_samples = sum(stacks.values())
+    self_counts = Counter()
+    total_counts = Counter()
+    for stack, count in stacks.items():
+        frames = stack.split(';')
+        self_counts[frames[-1]] += count
+        # Count recursive functions once per sample
+        for label in set(frames):
+            total_counts[label] += count
+
+    top_functions = []
+    for label, self_samples in self_counts.most_common(TOP_FUNCTIONS_LIMIT):
+        top_functions.append({
+            "function": label,
+            "selfSamples": self_samples,
+            "totalSamples": total_counts[label],
+            "selfPercent": round(100.0 * self_samples / total_samples, 1),
+            "totalPercent": round(100.0 * total_counts[label] / total_samples, 1)
+        })
+    return top_functions
+
+
+def profile_trigger():
+    """
+    Decide whether the current request is profiled and why.
+    Explicit requests need the global ADMIN_TOKEN, matching the profile
+    endpoints; any other request is counted towards 1-in-N route sampling.
+    """
+    if request.headers.get('X-Profile') == '1' or request.args.get('profile') == '1':
+        if is_admin_token(extract_token(), None):
+            return 'admin'
+
+    if PROFILE_SAMPLE_EVERY > 0 and request.url_rule is not None:
+        route_key = (request.method, request.url_rule.rule)
+        with _route_counters_lock:
+            _route_counters[route_key] += 1
+            if _route_counters[route_key] % PROFILE_SAMPLE_EVERY == 0:
+                return 'sampled'
+    return None
+
+
+def start_request_profile():
+    """before_request hook: start sampling the current request if asked to."""
+    if PROFILE_SAMPLE_EVERY <= 0 and 'X-Profile' not in request.headers and 'profile' not in request.args:
+        return
+
+    trigger = profile_trigger()
+    if trigger is None:
+        return
+
+    sampler = StackSampler(threading.get_ident(), PROFILE_INTERVAL_MS / 1000.0)
+    sampler.start()
+    g.profile_sampler = sampler
+    g.profile_trigger = trigger
+
+
+def finish_request_profile(response):
+    """after_request hook: stop sampling, save the profile and expose its id."""
+    sampler = g.pop('profile_sampler', None)
+    if sampler is None:
+        return response
+
+    sampler.stop()
+    profile_id = save_profile(sampler, g.pop('profile_trigger', None), response.status_code)
+    if profile_id:
+        response.headers['X-Profile-Id'] = profile_id
+    return response
+
+
+def stop_request_profile(exc):
+    """teardown_request hook: make sure no sampler outlives its request."""
+    sampler = g.pop('profile_sampler', None)
+    if sampler is not None:
+        sampler.stop()
+
+
+def save_profile(sampler, trigger, status_code):
+    """Write the collapsed stacks and a JSON summary; return the profile id."""
+    created_at = datetime.now(timezone.utc)
+    profile_id = f"{created_at:%Y%m%dT%H%M%S%f}-{trigger}-{uuid.uuid4().hex[:8]}"
+    summary = {
+        "id": profile_id,
+        "createdAt": created_at.isoformat(),
+        "trigger": trigger,
+        "method": request.method,
+        "path": request.path,
+        "route": request.url_rule.rule if request.url_rule is not None else None,
+        "status": status_code,
+        "durationMs": round(sampler.duration * 1000.0, 2),
+        "intervalMs": PROFILE_INTERVAL_MS,
+        "samples": sum(sampler.stacks.values()),
+        "topFunctions": summarize_stacks(sampler.stacks)
+    }
+
+    try:
+        os.makedirs(PROFILE_OUTPUT_DIR, exist_ok=True)
+        with open(os.path.join(PROFILE_OUTPUT_DIR, f"{profile_id}.collapsed"), 'w') as f:
+            for stack, count in sampler.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+        with open(os.path.join(PROFILE_OUTPUT_DIR, f"{profile_id}.json"), 'w') as f:
+            json.dump(summary, f)
+        prune_profiles(trigger, keep=profile_id)
+        return profile_id
+    except OSError as e:
+        print(f"Error saving profile {profile_id}: {e}")
+        return None
+
+
+def list_profile_ids():
+    """Return stored profile ids, newest first."""
+    if not os.path.isdir(PROFILE_OUTPUT_DIR):
+        return []
+    ids = [name[:-len('.json')] for name in os.listdir(PROFILE_OUTPUT_DIR) if name.endswith('.json')]
+    return sorted((i for i in ids if PROFILE_ID_PATTERN.match(i)), reverse=True)
+
+
+def prune_profiles(trigger, keep):
+    """
+    Keep only the newest PROFILE_MAX_FILES profiles of one trigger on disk,
+    so sampled traffic never evicts a profile an admin asked for.
+    The profile in `keep` is about to be handed out and is never removed.
+    """
+    profile_ids = [i for i in list_profile_ids() if i.split('-')[1] == trigger and i != keep]
+    for profile_id in profile_ids[max(PROFILE_MAX_FILES - 1, 0):]:
+        for extension in ('.json', '.collapsed'):
+            try:
+                os.remove(os.path.join(PROFILE_OUTPUT_DIR, f"{profile_id}{extension}"))
+            except FileNotFoundError:
+                pass
+
+
+def load_profile_summary(profile_id):
+    """Return a stored profile summary, or None if it does not exist."""
+    if not PROFILE_ID_PATTERN.match(profile_id):
+        return None
+    try:
+        with open(os.path.join(PROFILE_OUTPUT_DIR, f"{profile_id}.json")) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def load_profile_stacks(profile_id):
+    """Return the collapsed-stack text of a stored profile, or None."""
+    if not PROFILE_ID_PATTERN.match(profile_id):
+        return None
+    try:
+        with open(os.path.join(PROFILE_OUTPUT_DIR, f"{profile_id}.collapsed")) as f:
+            return f.read()
+    except OSError:
+        return None
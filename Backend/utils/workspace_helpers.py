@@ -0,0 +1,91 @@
+"""Helper functions for workspace partitioning and per-workspace read caching."""
+import threading
+from collections import OrderedDict
+from functools import wraps
+from flask import jsonify
+from config import DEFAULT_WORKSPACE, READ_CACHE_MAX_WORKSPACES, WORKSPACE_PATTERN
+
+
+def valid_workspace(workspace):
+    """Check that a workspace key is safe to use as a partition key."""
+    return bool(workspace) and WORKSPACE_PATTERN.match(workspace) is not None
+
+
+def workspace_scoped(func):
+    """
+    Decorator to validate the workspace URL segment.
+    Legacy /api/... routes carry no workspace and use the default one.
+    """
+    @wraps(func)
+    def wrapper(*args, workspace=DEFAULT_WORKSPACE, **kwargs):
+        if not valid_workspace(workspace):
+            return jsonify({"error": "Invalid workspace"}), 400
+        return func(*args, workspace=workspace, **kwargs)
+    return wrapper
+
+
+def get_workspace_version(cursor, workspace):
+    """Return the current write version of a workspace (0 if never written)."""
+    cursor.execute("SELECT version FROM workspace_versions WHERE workspace = %s", (workspace,))
+    row = cursor.fetchone()
+    if row is None:
+        return 0
+    return row['version'] if isinstance(row, dict) else row[0]
+
+
+def bump_workspace_version(cursor, workspace):
+    """
+    Mark a workspace as changed. Call inside the writing transaction so the
+    new version becomes visible together with the data it describes.
+    """
+    cursor.execute("""
+        INSERT INTO workspace_versions (workspace, version)
+        VALUES (%s, 1)
+        ON DUPLICATE KEY UPDATE version = version + 1
+    """, (workspace,))
+    read_cache.invalidate(workspace)
+
+
+class WorkspaceReadCache:
+    """
+    In-process cache of read results, partitioned by workspace.
+
+    Entries are tagged with the workspace version they were read at, so a
+    write from another worker process is picked up on the next read.
+    """
+
+    def __init__(self, max_workspaces):
+        self.max_workspaces = max_workspaces
+        self._partitions = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, workspace, key, version):
+        """Return a cached value, or None if missing or stale."""
+        with self._lock:
+            partition = self._partitions.get(workspace)
+            if partition is None or partition['version'] != version:
+                return None
+            self._partitions.move_to_end(workspace)
+            return partition['entries'].get(key)
+
+    def set(self, workspace, key, version, value):
+        """Store a value read at the given workspace version, unless a newer one is cached."""
+        with self._lock:
+            partition = self._partitions.get(workspace)
+            if partition is not None and version < partition['version']:
+                return
+            if partition is None or version > partition['version']:
+                partition = {'version': version, 'entries': {}}
+                self._partitions[workspace] = partition
+            partition['entries'][key] = value
+            self._partitions.move_to_end(workspace)
+            while len(self._partitions) > self.max_workspaces:
+                self._partitions.popitem(last=False)
+
+    def invalidate(self, workspace):
+        """Drop all cached reads for one workspace."""
+        with self._lock:
+            self._partitions.pop(workspace, None)
+
+
+read_cache = WorkspaceReadCache(READ_CACHE_MAX_WORKSPACES)